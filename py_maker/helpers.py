@@ -3,6 +3,9 @@
 from __future__ import annotations
 
 import datetime
+import functools
+import json
+import os
 import re
 import shutil
 import sys
@@ -24,6 +27,14 @@ if TYPE_CHECKING:  # pragma: no cover
 
 SUCCESS_RESPONSE = 200
 
+# the default Jinja delimiters for variables, statements and comments.
+JINJA_MARKERS: tuple[bytes, ...] = (b"{{", b"{%", b"{#")
+
+# matches any run of dashes, underscores or dots in a name.
+_SEPARATORS_RE = re.compile(r"[-_.]+")
+# translation table to turn all those separators into dashes.
+_TITLE_TABLE = str.maketrans("_.", "--")
+
 
 def get_author_and_email_from_git() -> tuple[str, str]:
     """Get the author name and email from git."""
@@ -46,34 +57,81 @@ def get_file_list(template_dir: Union[Traversable, Path]) -> list[Path]:
     """Return a list of files to be copied to the project directory.
 
     The root __init__.py file is excluded from the list, as it is only there so
-    that the template directory can be treated as a package.
-    """
-    skip_dirs: list[str] = ["__pycache__"]
+    that the template directory can be treated as a package. Any folders in
+    'skip_dirs' are not descended into at all.
 
-    file_list: list[Path] = [
-        item.relative_to(str(template_dir))
-        for item in template_dir.rglob("*")  # type: ignore
-        if set(item.parts).isdisjoint(skip_dirs)
-        and item.relative_to(str(template_dir)) != Path("__init__.py")
-    ]
+    Folders are always listed before their contents, so they can be created
+    in order.
+    """
+    skip_dirs: set[str] = {"__pycache__"}
+    root = str(template_dir)
+
+    file_list: list[Path] = []
+    folders: list[str] = [root]
+    while folders:
+        current = folders.pop()
+        with os.scandir(current) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    if entry.name in skip_dirs:
+                        continue
+                    folders.append(entry.path)
+                elif current == root and entry.name == "__init__.py":
+                    continue
+                file_list.append(Path(entry.path).relative_to(root))
 
     return file_list
 
 
+def is_static_template(content: bytes) -> bool:
+    """Return True if the template content contains no Jinja markup.
+
+    These templates would render to exactly the same content, so they can be
+    copied directly without going through the template engine.
+    """
+    return not any(marker in content for marker in JINJA_MARKERS)
+
+
+def toml_string(value: object) -> str:
+    """Return the value as a quoted TOML basic string.
+
+    This is used as a Jinja filter, since the values entered by the user may
+    contain quotes or backslashes. JSON string escapes are also valid in TOML,
+    except that TOML needs the DEL character escaped too.
+    """
+    return json.dumps(str(value), ensure_ascii=False).replace("\x7f", "\\u007f")
+
+
+def py_string(value: object) -> str:
+    """Return the value as a double-quoted Python string literal.
+
+    This is used as a Jinja filter, so that quotes or backslashes entered by
+    the user cannot break the generated Python code. JSON string escapes are
+    all valid in Python string literals too.
+    """
+    return json.dumps(str(value), ensure_ascii=False)
+
+
 def sanitize(input_str: Union[str, Path]) -> str:
     """Replace any dashes in the supplied string by underscores.
 
     Python needs underscores in library names, not dashes.
     """
-    return re.sub(r"[-_.]+", "_", str(input_str))
+    return _SEPARATORS_RE.sub("_", str(input_str))
 
 
 def get_title(key: str) -> str:
     """Get a 'titlized' version of the supplied string.
 
-    This removes dashes or underscore and titlizes each word.
+    This removes dashes, underscores or dots and titlizes each word. Runs of
+    these are treated as a single space, any other whitespace is kept as-is.
     """
-    return re.sub(r"[-_.]+", " ", key).title() if key != "." else ""
+    if key == ".":
+        return ""
+    title = key.translate(_TITLE_TABLE)
+    while "--" in title:
+        title = title.replace("--", "-")
+    return title.replace("-", " ").title()
 
 
 def pretty_attrib(attr: str) -> str:
@@ -111,11 +169,15 @@ def show_table(settings: dict[str, str]) -> None:
     console.print(table)
 
 
+@functools.lru_cache(maxsize=256)
 def exists_on_pypi(package_name: str) -> bool:
     """Check if the package name is available on PyPI.
 
     Return True if the package name already exists on PyPI, False otherwise.
     Timeout after 5 seconds, which also returns False.
+
+    The result is cached, so asking about the same name again in this session
+    does not make another request.
     """
     url = f"https://pypi.org/pypi/{package_name}/json"
     try:
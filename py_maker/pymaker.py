@@ -2,31 +2,35 @@
 
 from __future__ import annotations
 
+import functools
+import hashlib
 import importlib.resources as pkg_resources
 import os
 import re
 import shutil
 import subprocess  # nosec
 import sys
-from pathlib import Path, PurePath
-from typing import TYPE_CHECKING, Union
+import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from string import Template
+from typing import TYPE_CHECKING, Optional, Union
 
-from git.exc import GitError
-from git.repo import Repo
-from jinja2 import Environment, FileSystemLoader
 from rich import print  # pylint: disable=W0622
 
-from py_maker import template
+from py_maker import licenses, template
 from py_maker.config import get_settings
 from py_maker.constants import MKDOCS_CONFIG, ExitErrors, license_names
-from py_maker.github_ctrl import GitHub
 from py_maker.helpers import (
     exists_on_pypi,
     get_current_year,
     get_file_list,
     get_title,
     header,
+    is_static_template,
+    py_string,
     sanitize,
+    toml_string,
 )
 from py_maker.prompt import Confirm, Prompt
 from py_maker.schema import ProjectValues
@@ -34,6 +38,135 @@ from py_maker.schema import ProjectValues
 if TYPE_CHECKING:
     from importlib.resources.abc import Traversable
 
+    from jinja2 import BaseLoader, BytecodeCache, Environment
+
+# NOTE: 'jinja2', 'git' and 'github' are slow to import, so they are imported
+# in the methods that use them. This keeps the start-up time of the CLI down.
+
+# package names cannot contain dashes, dots or spaces.
+_INVALID_PKG_RE = re.compile(r"[- .]")
+# underscores and dots are replaced by dashes in the default repository name.
+_REPO_SEPARATORS_RE = re.compile(r"[_.]+")
+
+# the bytecode cache only checks the template source has not changed, so this
+# MUST be bumped whenever the options in 'new_environment' are changed.
+JINJA_CACHE_VERSION = 3
+
+# the internal templates are pre-compiled into this zip when the package is
+# built. See 'scripts/precompile_templates.py'. The zip also stores a checksum
+# of the templates it was compiled from, so it is ignored once they change.
+COMPILED_TEMPLATES = Path(__file__).parent / "template_compiled.zip"
+COMPILED_CHECKSUM = "templates.sha256"
+
+
+def new_environment(
+    loader: BaseLoader, bytecode_cache: Optional[BytecodeCache] = None
+) -> Environment:
+    """Return a new Jinja Environment with the options used for all templates.
+
+    The templates do not change while we are running, so 'auto_reload' is
+    disabled to stop Jinja checking the source files each time they are used.
+    """
+    from jinja2 import Environment, select_autoescape
+
+    jinja_env = Environment(
+        loader=loader,
+        bytecode_cache=bytecode_cache,
+        auto_reload=False,
+        # only HTML or XML output needs escaping, escaping other files just
+        # corrupts values such as '&' or '<' in the generated project.
+        autoescape=select_autoescape(
+            enabled_extensions=(
+                "html",
+                "htm",
+                "xml",
+                "html.jinja",
+                "htm.jinja",
+                "xml.jinja",
+            ),
+        ),
+        trim_blocks=True,
+        lstrip_blocks=True,
+        keep_trailing_newline=True,
+    )
+    # autoescape is off for the Python and TOML templates, so any user values
+    # in them must be quoted with these filters.
+    jinja_env.filters["py_string"] = py_string
+    jinja_env.filters["toml_string"] = toml_string
+    return jinja_env
+
+
+def templates_checksum(template_dir: Path) -> str:
+    """Return a checksum of all the '.jinja' templates in the folder.
+
+    JINJA_CACHE_VERSION is included too, as changing the Environment options
+    also means the compiled templates are out of date.
+    """
+    checksum = hashlib.sha256(f"v{JINJA_CACHE_VERSION}".encode())
+    for path in sorted(template_dir.rglob("*.jinja")):
+        checksum.update(path.relative_to(template_dir).as_posix().encode())
+        checksum.update(b"\0")
+        checksum.update(path.read_bytes())
+        checksum.update(b"\0")
+    return checksum.hexdigest()
+
+
+def compiled_templates_are_current(template_dir: Path) -> bool:
+    """Return True if the pre-compiled templates match the source templates."""
+    try:
+        with zipfile.ZipFile(COMPILED_TEMPLATES) as archive:
+            stored = archive.read(COMPILED_CHECKSUM).decode()
+    except (OSError, KeyError, zipfile.BadZipFile):
+        return False
+    return stored == templates_checksum(template_dir)
+
+
+def get_jinja_cache_dir() -> Path:
+    """Return the folder used to cache the compiled Jinja templates.
+
+    This is kept in the settings folder, alongside the user template folder.
+    """
+    return Path(get_settings().settings_folder) / "cache" / "jinja"
+
+
+@functools.cache
+def _get_env(template_dir: str) -> Environment:
+    """Return a cached Jinja Environment for the supplied template folder.
+
+    Building an Environment is expensive, and it caches the templates it has
+    already parsed, so we only want one per template folder. The compiled
+    templates are also stored on disk so later runs can skip compiling them.
+
+    If the internal templates have been pre-compiled from the current sources,
+    these are used first and we only fall back to the source templates if they
+    are missing.
+    """
+    from jinja2 import (
+        ChoiceLoader,
+        FileSystemBytecodeCache,
+        FileSystemLoader,
+        ModuleLoader,
+    )
+
+    loader: BaseLoader = FileSystemLoader(template_dir)
+    if template_dir == str(
+        pkg_resources.files(template)
+    ) and compiled_templates_are_current(Path(template_dir)):
+        loader = ChoiceLoader([ModuleLoader(str(COMPILED_TEMPLATES)), loader])
+
+    try:
+        cache_dir = get_jinja_cache_dir()
+        cache_dir.mkdir(parents=True, exist_ok=True)
+        bytecode_cache = FileSystemBytecodeCache(
+            directory=str(cache_dir),
+            pattern=f"__jinja2_v{JINJA_CACHE_VERSION}_%s.cache",
+        )
+    except OSError:
+        # we can still render the templates without a cache.
+        bytecode_cache = None
+
+    return new_environment(loader, bytecode_cache)
+
 
 class PyMaker:
     """PyMaker class."""
@@ -51,6 +184,10 @@ class PyMaker:
         self.poetry_is_run = False
         self.git_is_run = False
 
+        # these don't change during a run, so only look them up once.
+        self._template_dir: Traversable = pkg_resources.files(template)
+        self._current_year: str = get_current_year()
+
         header()
 
         self.settings = get_settings()
@@ -69,7 +206,7 @@ class PyMaker:
             "settings :\n"
         )
 
-        padding: int = max(len(key) for key, _ in self.choices) + 3
+        padding: int = ProjectValues.MAX_FIELD_NAME_LEN + 3
 
         for key, value in self.choices:
             print(f"{get_title(key).rjust(padding)} : [green]{value}")
@@ -80,13 +217,21 @@ class PyMaker:
     #                   create the project skeleton folders.                   #
     # ------------------------------------------------------------------------ #
     def create_folders(self) -> None:
-        """Create the root folder for the project."""
+        """Create the root folder for the project.
+
+        An existing folder is only used if it is empty.
+        """
         try:
             print("--> Creating project folder ... ", end="")
             if self.location != ".":
                 self.choices.project_dir.mkdir()
             print("[green]Done[/green]")
         except FileExistsError:
+            if self.choices.project_dir.is_dir() and not any(
+                self.choices.project_dir.iterdir()
+            ):
+                print("[green]Done[/green]")
+                return
             print(
                 f"\n[red]  -> Error: Directory '{self.choices.project_dir}' "
                 "already exists.\n"
@@ -107,32 +252,68 @@ class PyMaker:
     ) -> None:
         """Copy the template files to the project directory.
 
-        Expand the jinja templates before copying.
+        Expand the jinja templates before copying. Any user templates without
+        Jinja markup are copied as-is, skipping the template engine. The
+        internal templates all contain markup, so they are not checked.
+
+        The folders are created first, then the files are copied in parallel
+        as this is mostly waiting on the file system.
         """
-        jinja_env = Environment(
-            loader=FileSystemLoader(str(template_dir)),
-            autoescape=True,
-            trim_blocks=True,
-            lstrip_blocks=True,
-            keep_trailing_newline=True,
-        )
-        for file in file_list:
-            with pkg_resources.as_file(template_dir / file) as src:  # type: ignore
-                if src.is_dir():
-                    Path(self.choices.project_dir / file).mkdir()
-                elif src.suffix == ".jinja":
+        proj = self.choices.project_dir
+        # the context is the same for every template, so only build it once.
+        context = self.choices.model_dump()
+        context["slug"] = proj.name
+        context["options"] = self.options
+        check_static = str(template_dir) != str(self._template_dir)
+        # extract the whole template folder once (if needed), not file by file.
+        with pkg_resources.as_file(template_dir) as tdir_path:
+            jinja_env = _get_env(str(tdir_path))
+
+            def copy_file(file: Path) -> None:
+                """Copy or render a single file from the template folder."""
+                src = tdir_path / file
+                if src.suffix == ".jinja":
+                    dst = proj / file.with_suffix("")
+                    if check_static:
+                        content = src.read_bytes()
+                        if is_static_template(content):
+                            dst.write_bytes(content)
+                            return
                     jinja_template = jinja_env.get_template(str(file))
-                    dst = self.choices.project_dir / Path(file).with_suffix("")
-                    dst.write_text(
-                        jinja_template.render(
-                            self.choices.model_dump(),
-                            slug=self.choices.project_dir.name,
-                            options=self.options,
-                        )
-                    )
+                    dst.write_text(jinja_template.render(context))
+                else:
+                    shutil.copyfile(src, proj / file)
+
+            files: list[Path] = []
+            for file in file_list:
+                if (tdir_path / file).is_dir():
+                    (proj / file).mkdir()
                 else:
-                    dst = self.choices.project_dir / file
-                    dst.write_text(src.read_text(encoding="UTF-8"))
+                    files.append(file)
+
+            max_workers = min(8, (os.cpu_count() or 1) * 2)
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                # consume the results so any exception is raised here.
+                list(executor.map(copy_file, files))
+
+    def create_license(self) -> None:
+        """Create the LICENSE.txt file for the chosen license, if any.
+
+        The licenses only need the author and year substituted, so a simple
+        string Template is enough here.
+        """
+        if self.choices.license_name == "None":
+            return
+
+        license_text = (
+            pkg_resources.files(licenses) / f"{self.choices.license_name}.txt"
+        ).read_text(encoding="UTF-8")
+        dst = self.choices.project_dir / "LICENSE.txt"
+        dst.write_text(
+            Template(license_text).safe_substitute(
+                author=self.choices.author, year=self._current_year
+            )
+        )
 
     def generate_template(self) -> None:
         """Copy the template files to the project directory.
@@ -145,7 +326,7 @@ class PyMaker:
         """
         try:
             # ---------------- copy the default template files --------------- #
-            template_dir = pkg_resources.files(template)
+            template_dir = self._template_dir
             if self.settings.use_default_template:
                 file_list = get_file_list(template_dir)
                 self.copy_files(template_dir, file_list)
@@ -157,31 +338,17 @@ class PyMaker:
                 self.copy_files(custom_template_dir, file_list)
 
             # ---------------- generate the license file next. ------------- #
-            if self.choices.license_name != "None":
-                license_env = Environment(
-                    loader=FileSystemLoader(str(template_dir / "../licenses")),
-                    autoescape=True,
-                    keep_trailing_newline=True,
-                )
-                license_template = license_env.get_template(
-                    f"{self.choices.license_name}.jinja"
-                )
-                dst = self.choices.project_dir / "LICENSE.txt"
-                dst.write_text(
-                    license_template.render(
-                        author=self.choices.author, year=get_current_year()
-                    )
-                )
+            self.create_license()
 
             # ---------- rename or delete the 'app' dir if required ---------- #
             if not self.choices.standalone:
-                Path(self.choices.project_dir / "app").rename(
+                (self.choices.project_dir / "app").rename(
                     self.choices.project_dir / self.choices.package_name
                 )
             else:
                 # move the main.py into the root project folder and delete app
-                Path(self.choices.project_dir / "app" / "main.py").rename(
-                    Path(self.choices.project_dir / "main.py")
+                (self.choices.project_dir / "app" / "main.py").rename(
+                    self.choices.project_dir / "main.py"
                 )
                 shutil.rmtree(self.choices.project_dir / "app")
 
@@ -199,10 +366,16 @@ class PyMaker:
         """Create a Git repository for the project and add the first commit."""
         if not self.options["git"]:
             return
+
+        from git.exc import GitError
+        from git.repo import Repo
+
         try:
             print("\n--> Creating Git repository ... ", end="")
             repo = Repo.init(self.choices.project_dir)
-            repo.index.add(repo.untracked_files)
+            # stage everything with a single 'git add', rather than passing
+            # each untracked file through GitPython's index.
+            repo.git.add("--all")
             repo.index.commit("Initial Commit")
             print("[green]Done[/green]")
             self.git_is_run = True
@@ -265,7 +438,7 @@ See the [bold][green]README.md[/green][/bold] file for more information.
 
             # note: not happy with this nested if/else, but it works for now.
             # will fix during the next refactor.
-            if not re.search(r"[- .]", name):
+            if not _INVALID_PKG_RE.search(name):
                 if exists_on_pypi(name):
                     print(
                         "\n[red]Warning: Package name already exists on PyPI."
@@ -293,7 +466,7 @@ See the [bold][green]README.md[/green][/bold] file for more information.
     # ------------------------------------------------------------------------ #
     def accept_defaults(self) -> None:
         """Accept the default values for the project."""
-        self.choices.name = get_title(PurePath(self.choices.project_dir).name)
+        self.choices.name = get_title(self.choices.project_dir.name)
         self.choices.package_name = sanitize(self.choices.project_dir.name)
         self.choices.description = ""
         self.choices.author = self.settings.author_name
@@ -304,7 +477,7 @@ See the [bold][green]README.md[/green][/bold] file for more information.
         """Get the user input for the project."""
         self.choices.name = Prompt.ask(
             "Name of the Application?",
-            default=get_title(PurePath(self.choices.project_dir).name),
+            default=get_title(self.choices.project_dir.name),
         )
         pk_name = sanitize(self.location)
 
@@ -330,7 +503,7 @@ See the [bold][green]README.md[/green][/bold] file for more information.
             "Repository URL?",
             default=(
                 f"https://github.com/{github_username}/"
-                f"{re.sub(r'[_.]+', '-', repo_name.lower())}"
+                f"{_REPO_SEPARATORS_RE.sub('-', repo_name.lower())}"
             ),
         )
 
@@ -368,9 +541,9 @@ See the [bold][green]README.md[/green][/bold] file for more information.
         if self.options["accept_defaults"] or Confirm.ask(
             "\nShould I Run 'poetry install' now?", default=True
         ):
-            os.chdir(self.choices.project_dir)
             subprocess.run(
                 ["poetry", "install"],  # noqa: S603, S607
+                cwd=self.choices.project_dir,
                 check=True,
             )
             self.poetry_is_run = True
@@ -385,6 +558,7 @@ See the [bold][green]README.md[/green][/bold] file for more information.
                         "new",
                         ".",
                     ],
+                    cwd=self.choices.project_dir,
                     check=True,
                 )
                 # now copy the custom mkdocs.yml file
@@ -414,25 +588,34 @@ See the [bold][green]README.md[/green][/bold] file for more information.
             )
         ):
             print("\n--> Install and Update pre-commit hooks")
-            os.chdir(self.choices.project_dir)
-            subprocess.run(
-                [  # noqa: S603, S607
-                    "poetry",
-                    "run",
-                    "pre-commit",
-                    "install",
-                ],
-                check=True,
-            )
-            subprocess.run(
+            # 'autoupdate' is slow as it needs to fetch each of the hook repos,
+            # so start it in the background while we install the hooks.
+            autoupdate = subprocess.Popen(
                 [  # noqa: S603, S607
                     "poetry",
                     "run",
                     "pre-commit",
                     "autoupdate",
                 ],
-                check=True,
+                cwd=self.choices.project_dir,
             )
+            try:
+                subprocess.run(
+                    [  # noqa: S603, S607
+                        "poetry",
+                        "run",
+                        "pre-commit",
+                        "install",
+                    ],
+                    cwd=self.choices.project_dir,
+                    check=True,
+                )
+            finally:
+                return_code = autoupdate.wait()
+            if return_code:
+                raise subprocess.CalledProcessError(
+                    return_code, autoupdate.args
+                )
         else:
             print(
                 """\n  [red]Warning: pre-commit hooks not installed or updated.
@@ -470,8 +653,12 @@ See the [bold][green]README.md[/green][/bold] file for more information.
                 )
             )
         ):
+            from git.exc import GitError
+            from git.repo import Repo
+
+            from py_maker.github_ctrl import GitHub
+
             print("\n--> Creating remote repository on GitHub")
-            os.chdir(self.choices.project_dir)
             # get the repo name only from the full URL
             repo_name = Path(self.choices.repository).name
             github = GitHub(
@@ -520,11 +707,14 @@ See the [bold][green]README.md[/green][/bold] file for more information.
         """
         self.choices.project_dir = Path.cwd() / self.location
 
-        # ensure that the chosen location is empty.
-        if (
-            self.choices.project_dir.exists()
-            and len(os.listdir(self.choices.project_dir)) > 0
-        ):
+        # ensure that the chosen location is empty. Listing a missing folder
+        # fails, so we don't need a separate check that it exists.
+        try:
+            folder_not_empty = any(self.choices.project_dir.iterdir())
+        except FileNotFoundError:
+            folder_not_empty = False
+
+        if folder_not_empty:
             print(
                 "\n[red]Error: The chosen folder is not empty. "
                 "Please specify a different location.[/red]\n"
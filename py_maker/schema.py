@@ -1,7 +1,7 @@
 """Define some Pydantic schemas for the application."""
 
 from pathlib import Path
-from typing import Optional
+from typing import ClassVar, Optional
 
 from pydantic import BaseModel
 
@@ -28,3 +28,12 @@ class ProjectValues(ProjectSettings):
 
     homepage: Optional[str] = None
     repository: Optional[str] = None
+
+    # length of the longest field name, used to align the values when shown.
+    # The fields are only known once the class is built, so this is set below.
+    MAX_FIELD_NAME_LEN: ClassVar[int]
+
+
+ProjectValues.MAX_FIELD_NAME_LEN = max(
+    len(name) for name in ProjectValues.model_fields
+)
@@ -0,0 +1,53 @@
+"""Pre-compile the internal Jinja templates before building the package.
+
+The compiled templates are written to 'py_maker/template_compiled.zip', which
+is then shipped inside the wheel so that the templates do not need to be
+compiled the first time the application is run.
+
+This should be run before 'poetry build', using 'poe build' does this for you.
+"""
+
+import importlib.resources as pkg_resources
+import zipfile
+from pathlib import Path
+
+from jinja2 import FileSystemLoader
+
+from py_maker import template
+from py_maker.pymaker import (
+    COMPILED_CHECKSUM,
+    COMPILED_TEMPLATES,
+    new_environment,
+    templates_checksum,
+)
+
+
+def main() -> None:
+    """Compile all the '.jinja' files in the internal template folder.
+
+    The zip is built in a temporary file first, so a failed compile leaves any
+    existing zip untouched.
+    """
+    template_dir = Path(str(pkg_resources.files(template)))
+    # always compile from the source templates, never from an existing zip.
+    jinja_env = new_environment(FileSystemLoader(str(template_dir)))
+    temp_zip = COMPILED_TEMPLATES.with_name(f"{COMPILED_TEMPLATES.name}.tmp")
+    try:
+        jinja_env.compile_templates(
+            str(temp_zip),
+            extensions=["jinja"],
+            zip="deflated",
+            ignore_errors=False,
+        )
+        checksum = templates_checksum(template_dir)
+        with zipfile.ZipFile(temp_zip, "a") as archive:
+            archive.writestr(COMPILED_CHECKSUM, checksum)
+        # an atomic replace, so the old zip is kept if anything failed above.
+        temp_zip.replace(COMPILED_TEMPLATES)
+    finally:
+        temp_zip.unlink(missing_ok=True)
+    print(f"Compiled templates written to '{COMPILED_TEMPLATES}'")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,6 @@
 """Test suite for the helper functions."""
 
+import ast
 import datetime
 from importlib import metadata
 from pathlib import Path
@@ -17,12 +18,21 @@ from py_maker.helpers import (
     get_file_list,
     get_title,
     header,
+    is_static_template,
     pretty_attrib,
+    py_string,
     sanitize,
     show_table,
+    toml_string,
 )
 
 
+@pytest.fixture(autouse=True)
+def _clear_pypi_cache() -> None:
+    """Clear the cached PyPI lookups so each test makes a fresh request."""
+    exists_on_pypi.cache_clear()
+
+
 @pytest.fixture()
 def fs_setup(fs) -> str:
     """A fixture to set up the fake file system before each test."""
@@ -108,12 +118,50 @@ def test_get_file_list(fs) -> None:
     assert Path("__init__.py") not in file_list
 
 
+def test_get_file_list_skips_folders(fs) -> None:
+    """Test 'get_file_list' skips '__pycache__' and lists folders first."""
+    fs.create_file("/template/__init__.py")
+    fs.create_file("/template/__pycache__/module.cpython-311.pyc")
+    fs.create_file("/template/app/__init__.py")
+    file_list = get_file_list(Path("/template"))
+    assert Path("__pycache__") not in file_list
+    assert Path("__pycache__/module.cpython-311.pyc") not in file_list
+    assert file_list.index(Path("app")) < file_list.index(
+        Path("app/__init__.py")
+    )
+
+
+@pytest.mark.parametrize(
+    ("content", "expected"),
+    [
+        (b"plain text\n", True),
+        (b"", True),
+        (b"name = {{ name }}", False),
+        (b"{% if options.test %}", False),
+        (b"{# a comment #}", False),
+    ],
+)
+def test_is_static_template(content: bytes, *, expected: bool) -> None:
+    """Test the 'is_static_template' helper."""
+    assert is_static_template(content) is expected
+
+
 def test_exists_on_pypi_true(mocker) -> None:
     """Test the 'exists_on_pypi' helper."""
     mocker.patch("requests.get", return_value=mocker.Mock(status_code=200))
     assert exists_on_pypi("existing_package") is True
 
 
+def test_exists_on_pypi_is_cached(mocker) -> None:
+    """Test 'exists_on_pypi' only queries PyPI once for the same name."""
+    mock_get = mocker.patch(
+        "requests.get", return_value=mocker.Mock(status_code=200)
+    )
+    assert exists_on_pypi("existing_package") is True
+    assert exists_on_pypi("existing_package") is True
+    mock_get.assert_called_once()
+
+
 def test_exists_on_pypi_timeout(mocker) -> None:
     """Test the 'exists_on_pypi' giving a timeout."""
     mocker.patch("requests.get", side_effect=requests.exceptions.Timeout)
@@ -257,11 +305,52 @@ def test_get_title_with_underscore() -> None:
     assert get_title("test_name") == "Test Name"
 
 
+def test_get_title_with_mixed_separators() -> None:
+    """Test get_title treats runs of separators as a single space."""
+    assert get_title("my--test_.name") == "My Test Name"
+
+
+def test_get_title_keeps_whitespace() -> None:
+    """Test get_title leaves existing whitespace in the string alone."""
+    assert get_title("my  app") == "My  App"
+    assert get_title("a\tb") == "A\tB"
+    assert get_title("_private") == " Private"
+
+
 def test_get_title_with_dot() -> None:
     """Test get_title returns an empty string for a single dot."""
     assert get_title(".") == ""
 
 
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("plain", '"plain"'),
+        ('say "hi" & bye', '"say \\"hi\\" & bye"'),
+        ("back\\slash", '"back\\\\slash"'),
+        ("tab\tdel\x7f", '"tab\\tdel\\u007f"'),
+        (None, '"None"'),
+    ],
+)
+def test_toml_string(value: object, expected: str) -> None:
+    """Test 'toml_string' quotes and escapes values for TOML."""
+    assert toml_string(value) == expected
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ("plain", '"plain"'),
+        ('say "hi"', '"say \\"hi\\""'),
+        ("back\\slash", '"back\\\\slash"'),
+    ],
+)
+def test_py_string(value: object, expected: str) -> None:
+    """Test 'py_string' gives a Python literal that evaluates to the value."""
+    assert py_string(value) == expected
+    assert ast.literal_eval(py_string(value)) == value
+
+
 def test_pretty_attrib() -> None:
     """Test pretty_attrib formats attribute names nicely."""
     assert pretty_attrib("test_name") == "Test Name"
@@ -0,0 +1,139 @@
+"""Test the main PyMaker class."""
+
+from pathlib import Path
+from typing import Any
+
+import pytest
+
+from py_maker.constants import ExitErrors
+from py_maker.pymaker import PyMaker
+
+OPTIONS: dict[str, bool] = {
+    "test": True,
+    "lint": True,
+    "docs": True,
+    "git": True,
+    "github": False,
+    "standalone": False,
+    "accept_defaults": True,
+    "bare": False,
+}
+
+
+@pytest.fixture()
+def pymaker(mocker) -> PyMaker:
+    """Return a PyMaker instance without loading the real settings."""
+    mocker.patch("py_maker.pymaker.print")
+    mocker.patch("py_maker.pymaker.get_settings")
+    return PyMaker("test_project", dict(OPTIONS))
+
+
+@pytest.mark.parametrize("license_name", ["MIT", "Apache2"])
+def test_create_license(
+    pymaker: PyMaker, tmp_path: Path, license_name: str
+) -> None:
+    """Test the license has the year and author substituted verbatim."""
+    pymaker.choices.project_dir = tmp_path
+    pymaker.choices.license_name = license_name
+    pymaker.choices.author = "Tom & Jerry's Co"
+    pymaker._current_year = "2024"  # noqa: SLF001
+
+    pymaker.create_license()
+
+    license_text = (tmp_path / "LICENSE.txt").read_text(encoding="UTF-8")
+    assert "Copyright 2024 Tom & Jerry's Co" in license_text
+    assert "$year" not in license_text
+    assert "$author" not in license_text
+    assert "&amp;" not in license_text
+    assert "&#39;" not in license_text
+
+
+def test_create_license_none(pymaker: PyMaker, tmp_path: Path) -> None:
+    """Test no license file is created when no license is chosen."""
+    pymaker.choices.project_dir = tmp_path
+    pymaker.choices.license_name = "None"
+    pymaker.create_license()
+    assert not (tmp_path / "LICENSE.txt").exists()
+
+
+def test_create_folders_new_folder(pymaker: PyMaker, tmp_path: Path) -> None:
+    """Test a missing project folder is created."""
+    pymaker.choices.project_dir = tmp_path / "test_project"
+    pymaker.create_folders()
+    assert pymaker.choices.project_dir.is_dir()
+
+
+def test_create_folders_existing_empty_folder(
+    pymaker: PyMaker, tmp_path: Path
+) -> None:
+    """Test an existing but empty project folder is used."""
+    pymaker.choices.project_dir = tmp_path / "test_project"
+    pymaker.choices.project_dir.mkdir()
+    pymaker.create_folders()
+    assert pymaker.choices.project_dir.is_dir()
+
+
+def test_create_folders_existing_folder_not_empty(
+    pymaker: PyMaker, tmp_path: Path
+) -> None:
+    """Test an existing project folder with content exits with an error."""
+    pymaker.choices.project_dir = tmp_path / "test_project"
+    pymaker.choices.project_dir.mkdir()
+    (pymaker.choices.project_dir / "file.txt").write_text("content")
+    with pytest.raises(SystemExit) as exc_info:
+        pymaker.create_folders()
+    assert exc_info.value.code == ExitErrors.DIRECTORY_EXISTS
+
+
+def test_create_folders_existing_file(pymaker: PyMaker, tmp_path: Path) -> None:
+    """Test an existing file with the project folder name exits."""
+    pymaker.choices.project_dir = tmp_path / "test_project"
+    pymaker.choices.project_dir.write_text("content")
+    with pytest.raises(SystemExit) as exc_info:
+        pymaker.create_folders()
+    assert exc_info.value.code == ExitErrors.DIRECTORY_EXISTS
+
+
+def mock_run_stages(mocker, pymaker: PyMaker) -> dict[str, Any]:
+    """Mock out every stage called by 'run', returning the mocks by name."""
+    stages = [
+        "accept_defaults",
+        "create_folders",
+        "generate_template",
+        "run_poetry",
+        "create_git_repo",
+        "install_precommit",
+        "create_remote_repo",
+        "post_process",
+    ]
+    return {
+        stage: mocker.patch.object(pymaker, stage, autospec=True)
+        for stage in stages
+    }
+
+
+def test_run_missing_folder(
+    pymaker: PyMaker, tmp_path: Path, monkeypatch, mocker
+) -> None:
+    """Test 'run' continues when the project folder does not exist yet."""
+    monkeypatch.chdir(tmp_path)
+    stages = mock_run_stages(mocker, pymaker)
+    pymaker.run()
+    assert pymaker.choices.project_dir == tmp_path / "test_project"
+    stages["create_folders"].assert_called_once()
+    stages["post_process"].assert_called_once()
+
+
+def test_run_folder_not_empty(
+    pymaker: PyMaker, tmp_path: Path, monkeypatch, mocker
+) -> None:
+    """Test 'run' exits before doing anything if the folder is not empty."""
+    monkeypatch.chdir(tmp_path)
+    (tmp_path / "test_project").mkdir()
+    (tmp_path / "test_project" / "file.txt").write_text("content")
+    stages = mock_run_stages(mocker, pymaker)
+    with pytest.raises(SystemExit) as exc_info:
+        pymaker.run()
+    assert exc_info.value.code == ExitErrors.FOLDER_NOT_EMPTY
+    stages["accept_defaults"].assert_not_called()
+    stages["create_folders"].assert_not_called()
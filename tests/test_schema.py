@@ -88,3 +88,9 @@ def test_project_values_type_validation() -> None:
 
     with pytest.raises(ValidationError):
         ProjectValues(project_dir=123)  # type: ignore
+
+
+def test_project_values_max_field_name_len() -> None:
+    """Test MAX_FIELD_NAME_LEN matches the longest ProjectValues field name."""
+    longest = max(len(key) for key, _ in ProjectValues())
+    assert longest == ProjectValues.MAX_FIELD_NAME_LEN
@@ -0,0 +1,153 @@
+"""Test the Jinja template handling."""
+
+import ast
+import importlib.resources as pkg_resources
+import zipfile
+from pathlib import Path
+
+import pytest
+import rtoml
+from jinja2 import FileSystemLoader
+
+from py_maker import pymaker, template
+from py_maker.pymaker import (
+    COMPILED_CHECKSUM,
+    _get_env,
+    compiled_templates_are_current,
+    get_jinja_cache_dir,
+    new_environment,
+    templates_checksum,
+)
+from py_maker.schema import ProjectValues
+
+
+@pytest.fixture()
+def template_dir(tmp_path: Path) -> Path:
+    """Create a small template folder to test against."""
+    folder = tmp_path / "template"
+    (folder / "app").mkdir(parents=True)
+    (folder / "README.md.jinja").write_text("# {{ name }}\n")
+    (folder / "app" / "main.py.jinja").write_text("print('{{ name }}')\n")
+    return folder
+
+
+def write_compiled_zip(path: Path, checksum: str) -> None:
+    """Write a fake compiled templates zip with the supplied checksum."""
+    with zipfile.ZipFile(path, "w") as archive:
+        archive.writestr(COMPILED_CHECKSUM, checksum)
+
+
+def test_templates_checksum_changes_with_source(template_dir: Path) -> None:
+    """Test the checksum changes when a template is edited."""
+    before = templates_checksum(template_dir)
+    assert before == templates_checksum(template_dir)
+
+    (template_dir / "README.md.jinja").write_text("# {{ name }} edited\n")
+    assert templates_checksum(template_dir) != before
+
+
+def test_compiled_templates_are_current(
+    template_dir: Path, tmp_path: Path, mocker
+) -> None:
+    """Test the compiled zip is only used if it matches the templates."""
+    compiled = tmp_path / "template_compiled.zip"
+    mocker.patch.object(pymaker, "COMPILED_TEMPLATES", compiled)
+    write_compiled_zip(compiled, templates_checksum(template_dir))
+    assert compiled_templates_are_current(template_dir) is True
+
+    (template_dir / "README.md.jinja").write_text("# {{ name }} edited\n")
+    assert compiled_templates_are_current(template_dir) is False
+
+
+def test_compiled_templates_missing_or_invalid(
+    template_dir: Path, tmp_path: Path, mocker
+) -> None:
+    """Test a missing, corrupt or unchecked zip is never used."""
+    compiled = tmp_path / "template_compiled.zip"
+    mocker.patch.object(pymaker, "COMPILED_TEMPLATES", compiled)
+    assert compiled_templates_are_current(template_dir) is False
+
+    compiled.write_bytes(b"not a zip file")
+    assert compiled_templates_are_current(template_dir) is False
+
+    with zipfile.ZipFile(compiled, "w") as archive:
+        archive.writestr("tmpl_abc.py", "")
+    assert compiled_templates_are_current(template_dir) is False
+
+
+def test_jinja_cache_is_in_settings_folder(
+    template_dir: Path, tmp_path: Path, mocker
+) -> None:
+    """Test the compiled templates are cached under the settings folder."""
+    settings_folder = tmp_path / "settings"
+    mocker.patch(
+        "py_maker.pymaker.get_settings",
+        return_value=mocker.Mock(settings_folder=settings_folder),
+    )
+    cache_dir = settings_folder / "cache" / "jinja"
+    assert get_jinja_cache_dir() == cache_dir
+
+    _get_env.cache_clear()
+    try:
+        _get_env(str(template_dir)).get_template("README.md.jinja")
+    finally:
+        _get_env.cache_clear()
+    assert any(cache_dir.iterdir())
+
+
+@pytest.mark.parametrize("standalone", [False, True])
+def test_pyproject_template_is_valid_toml(*, standalone: bool) -> None:
+    """Test quotes, '&' and backslashes in values still give valid TOML."""
+    internal = Path(str(pkg_resources.files(template)))
+    jinja_env = new_environment(FileSystemLoader(str(internal)))
+    values = ProjectValues(
+        name="Test Project",
+        description='A "quoted" & <odd> thing\\',
+        package_name="test_project",
+        author='Jane "JD" Doe',
+        email="jane@example.com",
+        license_name="MIT",
+        standalone=standalone,
+        homepage='https://example.com/?a="b"',
+        repository="https://github.com/jane/test-project",
+    )
+
+    rendered = jinja_env.get_template("pyproject.toml.jinja").render(
+        values.model_dump(),
+        slug="test-project",
+        # rtoml wrongly rejects the (valid) dotted '[tool.ruff.lint.*]' tables,
+        # so leave out the linting section. It has no user supplied values.
+        options={"test": True, "lint": False, "docs": True},
+    )
+    config = rtoml.loads(rendered)
+
+    poetry = config["tool"]["poetry"]
+    assert poetry["description"] == 'A "quoted" & <odd> thing\\.'
+    assert poetry["authors"] == ['Jane "JD" Doe <jane@example.com>']
+    if not standalone:
+        assert poetry["homepage"] == 'https://example.com/?a="b"'
+
+
+@pytest.mark.parametrize("standalone", [False, True])
+def test_main_template_is_valid_python(*, standalone: bool) -> None:
+    """Test quotes and backslashes in the name still give valid Python."""
+    internal = Path(str(pkg_resources.files(template)))
+    jinja_env = new_environment(FileSystemLoader(str(internal)))
+    values = ProjectValues(
+        name='My "Cool" App & <Co> \\ it\'s',
+        standalone=standalone,
+    )
+
+    rendered = jinja_env.get_template("app/main.py.jinja").render(
+        values.model_dump(),
+        slug="my-cool-app",
+        options={"test": True, "lint": True, "docs": True},
+    )
+    tree = ast.parse(rendered)
+
+    strings = [
+        node.value
+        for node in ast.walk(tree)
+        if isinstance(node, ast.Constant) and isinstance(node.value, str)
+    ]
+    assert 'Welcome to My "Cool" App & <Co> \\ it\'s!' in strings